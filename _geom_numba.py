@@ -0,0 +1,178 @@
+import math
+import os
+import numpy as np
+
+# Numba is opt-in (COMIC_USE_NUMBA=1): importing it takes ~0.4s, far more than the
+# kernels save on one page or bubble, so it only pays off for long batch runs.
+# Otherwise (or if it is not installed) the kernels below run as plain Python.
+try:
+    if os.environ.get("COMIC_USE_NUMBA") != "1":
+        raise ImportError("Numba not requested")
+    from numba import njit
+except ImportError:
+    def njit(**kwargs):
+        return lambda f: f
+
+# Lines whose determinant is below this are treated as parallel/collinear
+_PARALLEL_EPS = 1e-12
+
+# --- Scalar Geometry Helpers (used by make_comic_page) ---
+
+@njit(cache=True)
+def add_shift(point, shift):
+    """Helper to add a 2D shift vector to a point."""
+    return (point[0] + shift[0], point[1] + shift[1])
+
+@njit(cache=True)
+def get_normal_shift_vector(p1, p2, magnitude, sign=1):
+    """
+    Calculates the unit vector perpendicular to the line segment (p1, p2) and scales it by magnitude.
+    sign=1 shifts to the 'right', in the direction of (Vy, -Vx). sign=-1 shifts to the 'left' (-Vy, Vx).
+    """
+    V_x = p2[0] - p1[0] 
+    V_y = p2[1] - p1[1] 
+    
+    # The normal (Vy, -Vx) has the same length as V, so scale it in one step
+    mag = math.hypot(V_x, V_y)
+    
+    if mag == 0.0:
+        return (0.0, 0.0)
+
+    k = sign * magnitude / mag
+    return (V_y * k, -V_x * k)
+
+@njit(cache=True)
+def get_line_intersection(p1, p2, p3, p4):
+    """
+    Finds the intersection point of two infinite lines defined by (p1, p2) and (p3, p4).
+    Returns (x, y), or (nan, nan) if parallel/collinear; callers test it with math.isnan.
+    """
+    a1 = p2[1] - p1[1]
+    b1 = p1[0] - p2[0]
+    c1 = a1 * p1[0] + b1 * p1[1]
+
+    a2 = p4[1] - p3[1]
+    b2 = p3[0] - p4[0]
+    c2 = a2 * p3[0] + b2 * p3[1]
+
+    det = a1 * b2 - a2 * b1
+
+    if abs(det) < _PARALLEL_EPS:
+        return (math.nan, math.nan)  # Parallel or collinear
+
+    x = (b2 * c1 - b1 * c2) / det
+    y = (a1 * c2 - a2 * c1) / det
+    return (x, y)
+
+# --- Geometry Kernel for the Lightning Split ---
+
+@njit(cache=True)
+def _compute_lightning_points(x_start_p1, x_end_p2, y_top, y_bottom, P1_WIDTH, gutter,
+                              top_x_ratio, bot_x_ratio, zig_y_ratio, zig_depth_x_ratio,
+                              zag_y_ratio, zag_depth_x_ratio):
+    """
+    Computes both panel outlines of a lightning split in one call.
+    Returns (p1_points, p2_points) as (6, 2) and (7, 2) float64 arrays, in the same
+    clockwise order draw_split_panels uses.
+    """
+    SHIFT = gutter / 2.0
+    # "+ 0.0" (here and at the edge points) makes int inputs float so Numba sees one tuple type in the isnan fallbacks
+    Y_TOP = y_top + 0.0
+    Y_BOTTOM = y_bottom + 0.0
+    panel_height = Y_BOTTOM - Y_TOP
+    x_start_p2 = x_end_p2 - P1_WIDTH
+
+    # 1. CENTER LINE (A_C to D_C) POINTS
+    A_C = (x_start_p1 + P1_WIDTH * top_x_ratio, Y_TOP)
+    B_C = (x_start_p1 + P1_WIDTH * zig_depth_x_ratio, Y_TOP + panel_height * zig_y_ratio)
+    C_C = (x_start_p1 + P1_WIDTH * zag_depth_x_ratio, Y_TOP + panel_height * zag_y_ratio)
+    D_C = (x_start_p1 + P1_WIDTH * bot_x_ratio, Y_BOTTOM)
+
+    # 2. CALCULATE SHIFT VECTORS
+    S_AB_R = get_normal_shift_vector(A_C, B_C, SHIFT, 1)
+    S_BC_R = get_normal_shift_vector(B_C, C_C, SHIFT, 1)
+    S_CD_R = get_normal_shift_vector(C_C, D_C, SHIFT, 1)
+    S_AB_L = get_normal_shift_vector(A_C, B_C, SHIFT, -1)
+    S_BC_L = get_normal_shift_vector(B_C, C_C, SHIFT, -1)
+    S_CD_L = get_normal_shift_vector(C_C, D_C, SHIFT, -1)
+
+    # 3. CALCULATE RAW SHIFTED POINTS
+    E_raw = add_shift(A_C, S_AB_R)
+    B_prime_AB_R = add_shift(B_C, S_AB_R)
+    B_prime_BC_R = add_shift(B_C, S_BC_R)
+    C_prime_BC_R = add_shift(C_C, S_BC_R)
+    C_prime_CD_R = add_shift(C_C, S_CD_R)
+    D_prime_R = add_shift(D_C, S_CD_R)
+    I_raw = add_shift(A_C, S_AB_L)
+    B_prime_AB_L = add_shift(B_C, S_AB_L)
+    B_prime_BC_L = add_shift(B_C, S_BC_L)
+    C_prime_BC_L = add_shift(C_C, S_BC_L)
+    C_prime_CD_L = add_shift(C_C, S_CD_L)
+    D_prime_L = add_shift(D_C, S_CD_L)
+
+    # 4. CALCULATE INTERSECTIONS (The four jagged corner points: F, G, J, K)
+    F = get_line_intersection(E_raw, B_prime_AB_R, B_prime_BC_R, C_prime_BC_R)
+    F = B_prime_AB_R if math.isnan(F[0]) else F
+    G = get_line_intersection(B_prime_BC_R, C_prime_BC_R, C_prime_CD_R, D_prime_R)
+    G = C_prime_BC_R if math.isnan(G[0]) else G
+    J = get_line_intersection(I_raw, B_prime_AB_L, B_prime_BC_L, C_prime_BC_L)
+    J = B_prime_AB_L if math.isnan(J[0]) else J
+    K = get_line_intersection(B_prime_BC_L, C_prime_BC_L, C_prime_CD_L, D_prime_L)
+    K = C_prime_BC_L if math.isnan(K[0]) else K
+
+    # 5. CALCULATE TOP/BOTTOM EDGE INTERSECTIONS to seal the panel
+    TOP_EDGE_P1 = (x_start_p1 + 0.0, Y_TOP)
+    TOP_EDGE_P2 = (x_end_p2 + 0.0, Y_TOP)
+    BOT_EDGE_P1 = (x_start_p1 + 0.0, Y_BOTTOM)
+    BOT_EDGE_P2 = (x_end_p2 + 0.0, Y_BOTTOM)
+
+    # Raw points already sit on the edges, so they are the fallback
+    E_top = get_line_intersection(E_raw, F, TOP_EDGE_P1, TOP_EDGE_P2)
+    E_top = E_raw if math.isnan(E_top[0]) else E_top
+    H_bot = get_line_intersection(G, D_prime_R, BOT_EDGE_P1, BOT_EDGE_P2)
+    H_bot = D_prime_R if math.isnan(H_bot[0]) else H_bot
+    I_top = get_line_intersection(I_raw, J, TOP_EDGE_P1, TOP_EDGE_P2)
+    I_top = I_raw if math.isnan(I_top[0]) else I_top
+    L_bot = get_line_intersection(K, D_prime_L, BOT_EDGE_P1, BOT_EDGE_P2)
+    L_bot = D_prime_L if math.isnan(L_bot[0]) else L_bot
+
+    # 6. ASSEMBLE FINAL PANEL POINTS
+    # Panel 1: TL -> I_top -> J -> K -> L_bot -> BL
+    p1_points = np.empty((6, 2))
+    p1_points[0, 0], p1_points[0, 1] = x_start_p1, Y_TOP
+    p1_points[1, 0], p1_points[1, 1] = I_top
+    p1_points[2, 0], p1_points[2, 1] = J
+    p1_points[3, 0], p1_points[3, 1] = K
+    p1_points[4, 0], p1_points[4, 1] = L_bot
+    p1_points[5, 0], p1_points[5, 1] = x_start_p1, Y_BOTTOM
+
+    # Panel 2: TR -> BR -> BL_P2 -> H_bot -> G -> F -> E_top
+    p2_points = np.empty((7, 2))
+    p2_points[0, 0], p2_points[0, 1] = x_end_p2, Y_TOP
+    p2_points[1, 0], p2_points[1, 1] = x_end_p2, Y_BOTTOM
+    p2_points[2, 0], p2_points[2, 1] = x_start_p2, Y_BOTTOM
+    p2_points[3, 0], p2_points[3, 1] = H_bot
+    p2_points[4, 0], p2_points[4, 1] = G
+    p2_points[5, 0], p2_points[5, 1] = F
+    p2_points[6, 0], p2_points[6, 1] = E_top
+
+    return p1_points, p2_points
+
+# --- Geometry Kernel for the Thought Bubble Tail ---
+# The bubble constants are passed in rather than read from thought_bubble's globals.
+
+@njit(cache=True)
+def _thought_tail_circles(s, c, tail_length, center_x, center_y, cloud_radius, num_circles):
+    """
+    Computes the diminishing tail circles for a tail angle with sine s and cosine c.
+    Returns an (num_circles, 3) float64 array of (cx, cy, radius) rows, smallest distance first.
+    """
+    step = tail_length / num_circles
+    start_radius = cloud_radius + step
+    circles = np.empty((num_circles, 3))
+    for i in range(num_circles):
+        distance_from_center = start_radius + i * step
+        circles[i, 0] = center_x + distance_from_center * s
+        circles[i, 1] = center_y - distance_from_center * c
+        circles[i, 2] = 5 + (num_circles - 1 - i) * 3
+    return circles
@@ -1,5 +1,6 @@
 import svgwrite
 import math
+from functools import lru_cache
 
 # --- Configuration for the SVG Drawing ---
 FILENAME = 'speech_bubble.svg'
@@ -25,10 +26,20 @@ SHADOW_COLORS = {
     10: '#000000' # Pure Black
 }
 
+# --- Tail Angle Constants: sin/cos of the fixed tail offsets, computed once ---
+_OFFSET_RAD = math.radians(5)   # Angular spread for the base (5 degrees on each side)
+_COS_OFF = math.cos(_OFFSET_RAD)
+_SIN_OFF = math.sin(_OFFSET_RAD)
+_CBA = math.radians(2)          # 2 degrees angular displacement for the curve
+_COS_CBA = math.cos(_CBA)
+_SIN_CBA = math.sin(_CBA)
 
+
+@lru_cache(maxsize=None)
 def time_to_angle(hour, minute):
     """
     Calculates the total degrees (clockwise from 12 o'clock) for the clock hand.
+    Cached: there are only 12 x 60 distinct inputs.
     """
     # Convert 12-hour format to 0-11 for calculation (12 o'clock is 0 for degrees)
     h = hour % 12 
@@ -39,75 +50,96 @@ def time_to_angle(hour, minute):
     
     return angle_degrees
 
-def calculate_full_bubble_path_from_angle(angle_degrees, offset_x=0, offset_y=0, tail_length=15):
+def _bubble_points(angle_degrees, tail_length=15):
     """
-    Calculates the geometry for the smooth, bent tail and generates the SVG Path data string 
-    for the entire combined shape (main oval body arc + bent tail).
-    
-    The path now uses Quadratic Bézier curves (Q) to introduce a smooth bend.
+    Calculates the geometry for the smooth, bent tail around the unshifted bubble center.
+    Returns the five path points (P1, P2, P_Tip, C1, C2) as (x, y) tuples.
     """
     ANGLE_RAD = math.radians(angle_degrees)
     
     # --- Tail Geometry Configuration ---
     TIP_EXTENSION = tail_length 
-    OFFSET_RAD = math.radians(5)    # Angular spread for the base (5 degrees on each side)
     
     # Configuration for the curve's bend (relative to the angle)
-    CURVE_BEND_ANGLE = math.radians(2) # 2 degrees angular displacement for the curve
     CURVE_BEND_RADIUS_RATIO = 0.6      # Control point placed 60% of the way to the tip
     
+    # Only the tail angle itself needs trig; the offset angles (5 and 2 degrees)
+    # follow from the angle-sum identities and the module-level constants.
+    s = math.sin(ANGLE_RAD)
+    c = math.cos(ANGLE_RAD)
+    
+    # Points are page coordinates around the unshifted center; the caller adds the shadow offset
+    
     # --- 1. Calculate the Base Points (P1 and P2) on the ellipse's circumference ---
     
-    # P1 (Base Left) - Start of the perimeter drawing
-    P1_X = (CENTER_X + offset_x) + RX * math.sin(ANGLE_RAD - OFFSET_RAD)
-    P1_Y = (CENTER_Y + offset_y) - RY * math.cos(ANGLE_RAD - OFFSET_RAD)
+    # P1 (Base Left) - Start of the perimeter drawing (ANGLE_RAD - OFFSET)
+    P1_X = CENTER_X + RX * (s * _COS_OFF - c * _SIN_OFF)
+    P1_Y = CENTER_Y - RY * (c * _COS_OFF + s * _SIN_OFF)
 
-    # P2 (Base Right) - End of the large arc
-    P2_X = (CENTER_X + offset_x) + RX * math.sin(ANGLE_RAD + OFFSET_RAD)
-    P2_Y = (CENTER_Y + offset_y) - RY * math.cos(ANGLE_RAD + OFFSET_RAD)
+    # P2 (Base Right) - End of the large arc (ANGLE_RAD + OFFSET)
+    P2_X = CENTER_X + RX * (s * _COS_OFF + c * _SIN_OFF)
+    P2_Y = CENTER_Y - RY * (c * _COS_OFF - s * _SIN_OFF)
     
     # --- 2. Calculate the Single Tip Point (P_Tip) ---
     
     # P_Tip: 100% length, pointing straight out along the angle line.
     R_Tip = RX + TIP_EXTENSION 
-    P_Tip_X = (CENTER_X + offset_x) + R_Tip * math.sin(ANGLE_RAD)
-    P_Tip_Y = (CENTER_Y + offset_y) - R_Tip * math.cos(ANGLE_RAD)
+    P_Tip_X = CENTER_X + R_Tip * s
+    P_Tip_Y = CENTER_Y - R_Tip * c
 
     # --- 3. Calculate Control Points for the Bends (C1 and C2) ---
     
-    # C1 (Controls P2 -> P_Tip side): Slightly displaced angularly
+    # C1 (Controls P2 -> P_Tip side): Slightly displaced angularly (ANGLE_RAD + CURVE_BEND)
     R_C1 = RX + TIP_EXTENSION * CURVE_BEND_RADIUS_RATIO 
-    Angle_C1 = ANGLE_RAD + CURVE_BEND_ANGLE 
-    C1_X = (CENTER_X + offset_x) + R_C1 * math.sin(Angle_C1)
-    C1_Y = (CENTER_Y + offset_y) - R_C1 * math.cos(Angle_C1)
+    C1_X = CENTER_X + R_C1 * (s * _COS_CBA + c * _SIN_CBA)
+    C1_Y = CENTER_Y - R_C1 * (c * _COS_CBA - s * _SIN_CBA)
 
-    # C2 (Controls P_Tip -> P1 side): Mirror displacement angularly
+    # C2 (Controls P_Tip -> P1 side): Mirror displacement angularly (ANGLE_RAD - CURVE_BEND)
     R_C2 = RX + TIP_EXTENSION * CURVE_BEND_RADIUS_RATIO 
-    Angle_C2 = ANGLE_RAD - CURVE_BEND_ANGLE 
-    C2_X = (CENTER_X + offset_x) + R_C2 * math.sin(Angle_C2)
-    C2_Y = (CENTER_Y + offset_y) - R_C2 * math.cos(Angle_C2)
+    C2_X = CENTER_X + R_C2 * (s * _COS_CBA - c * _SIN_CBA)
+    C2_Y = CENTER_Y - R_C2 * (c * _COS_CBA + s * _SIN_CBA)
+
+    return [(P1_X, P1_Y), (P2_X, P2_Y), (P_Tip_X, P_Tip_Y), (C1_X, C1_Y), (C2_X, C2_Y)]
+
+def _format_bubble_path(points):
+    """
+    Generates the SVG Path data string for the entire combined shape from the
+    _bubble_points points (main oval body arc + bent tail).
+    """
+    (P1_X, P1_Y), (P2_X, P2_Y), (P_Tip_X, P_Tip_Y), (C1_X, C1_Y), (C2_X, C2_Y) = points
 
     # --- SVG Path Construction for the ENTIRE Oval Shape (Single Line) ---
-    
-    full_path = (
-        f"M {P1_X},{P1_Y} " 
+    # Coordinates are rounded to 3 decimals; more digits add bytes, not detail.
+    full_path = " ".join((
+        "M", f"{P1_X:.3f},{P1_Y:.3f}",
         # Main Oval Body Arc
-        f"A {RX},{RY} 0 1,0 {P2_X},{P2_Y} " 
+        "A", f"{RX},{RY}", "0 1,0", f"{P2_X:.3f},{P2_Y:.3f}",
         
         # Curve 1: P2 (Base Right) -> P_Tip using C1 as control point
-        f"Q {C1_X},{C1_Y} {P_Tip_X},{P_Tip_Y} " 
+        "Q", f"{C1_X:.3f},{C1_Y:.3f}", f"{P_Tip_X:.3f},{P_Tip_Y:.3f}",
         
         # Curve 2: P_Tip -> P1 (Base Left) using C2 as control point
         # The 'Z' command is omitted as the second Q command targets P1, closing the path.
-        f"Q {C2_X},{C2_Y} {P1_X},{P1_Y} "
-    )
+        "Q", f"{C2_X:.3f},{C2_Y:.3f}", f"{P1_X:.3f},{P1_Y:.3f}"
+    ))
 
     return full_path
 
-def create_custom_bubble(angle_degrees, hour, minute, shadow_size, shade_level, tail_length, bubble_text):
+def calculate_full_bubble_path_from_angle(angle_degrees, offset_x=0, offset_y=0, tail_length=15):
+    """
+    Calculates the geometry for the smooth, bent tail and generates the SVG Path data string 
+    for the entire combined shape (main oval body arc + bent tail).
+    
+    The path now uses Quadratic Bézier curves (Q) to introduce a smooth bend.
+    """
+    points = _bubble_points(angle_degrees, tail_length)
+    return _format_bubble_path([(x + offset_x, y + offset_y) for x, y in points])
+
+def create_custom_bubble(angle_degrees, hour, minute, shadow_size, shade_level, tail_length, bubble_text, filename=FILENAME):
     """
     Generates an SVG file containing the oval bubble with the smooth tail (based on time angle) 
-    and shadow, displaying custom text.
+    and shadow, displaying custom text. Everything comes in as parameters (no prompts), so
+    this can also be called from other scripts; the file is written to filename.
     """
     
     # Set offsets and color based on user input
@@ -116,11 +148,14 @@ def create_custom_bubble(angle_degrees, hour, minute, shadow_size, shade_level,
     # Get color from the dictionary based on the level (default to black if level is out of range)
     SHADOW_COLOR = SHADOW_COLORS.get(shade_level, '#000000') 
     
+    # The shadow has the same shape as the bubble, so the geometry is calculated once
+    points = _bubble_points(angle_degrees, tail_length)
+    
     # Calculate the path for the main bubble (no offset)
-    main_bubble_path = calculate_full_bubble_path_from_angle(angle_degrees, tail_length=tail_length)
+    main_bubble_path = _format_bubble_path(points)
     
-    # Calculate the path for the shadow (with offset)
-    shadow_path = calculate_full_bubble_path_from_angle(angle_degrees, SHADOW_OFFSET_X, SHADOW_OFFSET_Y, tail_length=tail_length)
+    # Calculate the path for the shadow (same points, moved by the offset)
+    shadow_path = _format_bubble_path([(x + SHADOW_OFFSET_X, y + SHADOW_OFFSET_Y) for x, y in points])
     
     # BOLD STROKE for Comic Book Look
     STROKE_WIDTH = 4
@@ -128,7 +163,7 @@ def create_custom_bubble(angle_degrees, hour, minute, shadow_size, shade_level,
     STROKE_COLOR = 'black'
     
     # Create the drawing object
-    dwg = svgwrite.Drawing(FILENAME, size=(WIDTH, HEIGHT), profile='full')
+    dwg = svgwrite.Drawing(filename, size=(WIDTH, HEIGHT), profile='full')
     
     # --- Draw the Shadow First (so it appears behind the main bubble) ---
     # The shadow is filled with the user-selected gray and has no stroke/border
@@ -161,8 +196,8 @@ def create_custom_bubble(angle_degrees, hour, minute, shadow_size, shade_level,
     ))
 
     # Save the SVG file
-    dwg.save(pretty=True)
-    print(f"Successfully generated {FILENAME} with text: '{bubble_text}' and angle corresponding to {hour:02d}:{minute:02d}.")
+    dwg.save()
+    print(f"Successfully generated {filename} with text: '{bubble_text}' and angle corresponding to {hour:02d}:{minute:02d}.")
 
 
 def get_user_input():
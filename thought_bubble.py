@@ -1,5 +1,14 @@
-import svgwrite
-import math
+import argparse
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from math import atan2, ceil, cos, pi, radians, sin, sqrt, tan
+import numpy as np
+from functools import lru_cache
+from html import escape
+
+from _geom_numba import _thought_tail_circles
 
 # --- Configuration for the SVG Drawing ---
 FILENAME = 'bubble_generator.svg'
@@ -12,24 +21,59 @@ RX = 150  # Horizontal Radius (Wider)
 RY = 100  # Vertical Radius (Shorter)
 CLOUD_RADIUS = 130 # Base size for the cloud body circles
 
-# --- Shadow Configuration: Maps user input (1-10) to hex color ---
-SHADOW_COLORS = {
-    1: '#E0E0E0', # Very Light Gray
-    2: '#C0C0C0', # Light Gray
-    3: '#A0A0A0',
-    4: '#808080', # Medium Gray
-    5: '#606060',
-    6: '#404040',
-    7: '#303030',
-    8: '#202020',
-    9: '#101010',
-    10: '#000000' # Pure Black
-}
+# The whole output file; body is the concatenated shape/text markup
+_SVG_TEMPLATE = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="{width}" height="{height}">{body}</svg>\n'
+)
+
+# --- Shadow Configuration: user input (1-10) picks SHADOW_COLORS[level - 1] ---
+SHADOW_COLORS = (
+    '#E0E0E0', # 1: Very Light Gray
+    '#C0C0C0', # 2: Light Gray
+    '#A0A0A0',
+    '#808080', # 4: Medium Gray
+    '#606060',
+    '#404040',
+    '#303030',
+    '#202020',
+    '#101010',
+    '#000000', # 10: Pure Black
+)
+
+# --- Speech Tail Spread: base points 5 degrees, bend points 2 degrees either side of the tail ---
+_OFFSET_RAD = radians(5)   # Angular spread for the base
+_COS_OFF = cos(_OFFSET_RAD)
+_SIN_OFF = sin(_OFFSET_RAD)
+_CBA = radians(2)          # Angular displacement for the curve
+_COS_CBA = cos(_CBA)
+_SIN_CBA = sin(_CBA)
+
+# --- Tail Angle Table: time_to_angle only yields multiples of 0.5 degrees ---
+_SINCOS = tuple((sin(radians(i * 0.5)), cos(radians(i * 0.5))) for i in range(720))
 
+# --- Cloud Outline: the 12 perimeter points as ratios of CLOUD_RADIUS ---
+# Coordinates are slightly offset for an irregular, hand-drawn look
+_CLOUD_RATIOS = np.array([
+    [0.9, -0.1],
+    [0.8, -0.4],
+    [0.4, -0.9],
+    [0.1, -0.8],
+    [-0.5, -0.9],
+    [-0.9, -0.5],
+    [-0.8, -0.1],
+    [-0.9, 0.5],
+    [-0.4, 0.8],
+    [0.1, 0.9],
+    [0.5, 0.8],
+    [0.9, 0.4],
+], dtype=np.float64)
 
+@lru_cache(maxsize=None)
 def time_to_angle(hour, minute):
     """
     Calculates the total degrees (clockwise from 12 o'clock) for positioning the tail/bubbles.
+    The result is cached per (hour, minute), as batch runs repeat clock positions.
     """
     # Convert 12-hour format to 0-11 for calculation (12 o'clock is 0 for degrees)
     h = hour % 12 
@@ -39,186 +83,261 @@ def time_to_angle(hour, minute):
     angle_degrees = (h * 30) + (minute * 0.5)
     return angle_degrees
 
+def _sin_cos(angle_degrees):
+    """
+    Returns (sin, cos) of the angle, read from _SINCOS when it is on the half-degree grid.
+    """
+    index = angle_degrees * 2
+    if index == int(index):
+        return _SINCOS[int(index) % 720]
+    ANGLE_RAD = radians(angle_degrees)
+    return sin(ANGLE_RAD), cos(ANGLE_RAD)
+
 # --- SPEECH BUBBLE GEOMETRY (Oval Body, Curved Tail) ---
 
-def calculate_speech_bubble_path(angle_degrees, offset_x=0, offset_y=0, tail_length=15):
+def calculate_speech_bubble_paths(angle_degrees, offsets, tail_length=15):
     """
-    Calculates the single-line SVG Path data string for the oval bubble with the bent tail.
+    Calculates the single-line SVG Path data strings for the oval bubble with the bent tail,
+    one per (offset_x, offset_y) in offsets. The geometry is computed once and shifted.
     """
-    ANGLE_RAD = math.radians(angle_degrees)
     TIP_EXTENSION = tail_length 
-    OFFSET_RAD = math.radians(5)    # Angular spread for the base
-    CURVE_BEND_ANGLE = math.radians(2) 
     CURVE_BEND_RADIUS_RATIO = 0.6
     
-    # 1. Base Points (P1 and P2) on the ellipse's circumference
-    P1_X = (CENTER_X + offset_x) + RX * math.sin(ANGLE_RAD - OFFSET_RAD)
-    P1_Y = (CENTER_Y + offset_y) - RY * math.cos(ANGLE_RAD - OFFSET_RAD)
-    P2_X = (CENTER_X + offset_x) + RX * math.sin(ANGLE_RAD + OFFSET_RAD)
-    P2_Y = (CENTER_Y + offset_y) - RY * math.cos(ANGLE_RAD + OFFSET_RAD)
+    # sin/cos of the tail angle A; the spread and bend points use sin(A +/- d) = s*cos(d) +/- c*sin(d)
+    s, c = _sin_cos(angle_degrees)
+    
+    # 1. Base Points (P1 and P2) on the ellipse's circumference (ANGLE_RAD -/+ OFFSET)
+    P1_X = CENTER_X + RX * (s * _COS_OFF - c * _SIN_OFF)
+    P1_Y = CENTER_Y - RY * (c * _COS_OFF + s * _SIN_OFF)
+    P2_X = CENTER_X + RX * (s * _COS_OFF + c * _SIN_OFF)
+    P2_Y = CENTER_Y - RY * (c * _COS_OFF - s * _SIN_OFF)
     
     # 2. Tip Point (P_Tip)
     R_Tip = RX + TIP_EXTENSION 
-    P_Tip_X = (CENTER_X + offset_x) + R_Tip * math.sin(ANGLE_RAD)
-    P_Tip_Y = (CENTER_Y + offset_y) - R_Tip * math.cos(ANGLE_RAD)
+    P_Tip_X = CENTER_X + R_Tip * s
+    P_Tip_Y = CENTER_Y - R_Tip * c
 
-    # 3. Control Points for the Bends (C1 and C2)
+    # 3. Control Points for the Bends (C1 at ANGLE_RAD + bend, C2 at ANGLE_RAD - bend)
     R_C1 = RX + TIP_EXTENSION * CURVE_BEND_RADIUS_RATIO 
-    Angle_C1 = ANGLE_RAD + CURVE_BEND_ANGLE 
-    C1_X = (CENTER_X + offset_x) + R_C1 * math.sin(Angle_C1)
-    C1_Y = (CENTER_Y + offset_y) - R_C1 * math.cos(Angle_C1)
+    C1_X = CENTER_X + R_C1 * (s * _COS_CBA + c * _SIN_CBA)
+    C1_Y = CENTER_Y - R_C1 * (c * _COS_CBA - s * _SIN_CBA)
 
     R_C2 = RX + TIP_EXTENSION * CURVE_BEND_RADIUS_RATIO 
-    Angle_C2 = ANGLE_RAD - CURVE_BEND_ANGLE 
-    C2_X = (CENTER_X + offset_x) + R_C2 * math.sin(Angle_C2)
-    C2_Y = (CENTER_Y + offset_y) - R_C2 * math.cos(Angle_C2)
+    C2_X = CENTER_X + R_C2 * (s * _COS_CBA - c * _SIN_CBA)
+    C2_Y = CENTER_Y - R_C2 * (c * _COS_CBA + s * _SIN_CBA)
+
+    points = [(P1_X, P1_Y), (P2_X, P2_Y), (C1_X, C1_Y), (P_Tip_X, P_Tip_Y), (C2_X, C2_Y)]
 
     # SVG Path Construction (M -> A -> Q -> Q)
-    full_path = (
-        f"M {P1_X},{P1_Y} " 
-        f"A {RX},{RY} 0 1,0 {P2_X},{P2_Y} " 
-        f"Q {C1_X},{C1_Y} {P_Tip_X},{P_Tip_Y} " 
-        f"Q {C2_X},{C2_Y} {P1_X},{P1_Y} "
-    )
-    return full_path
+    # Offsets are applied here and every coordinate written to the thousandth of a pixel
+    paths = []
+    for offset_x, offset_y in offsets:
+        p1, p2, c1, tip, c2 = [f"{x + offset_x:.3f},{y + offset_y:.3f}" for x, y in points]
+        paths.append(" ".join(("M", p1, "A", f"{RX},{RY}", "0 1,0", p2, "Q", c1, tip, "Q", c2, p1)))
+    return paths
+
+def calculate_speech_bubble_path(angle_degrees, offset_x=0, offset_y=0, tail_length=15):
+    """
+    Calculates the single-line SVG Path data string for the oval bubble with the bent tail.
+    """
+    return calculate_speech_bubble_paths(angle_degrees, [(offset_x, offset_y)], tail_length)[0]
 
 # --- THOUGHT BUBBLE GEOMETRY (Cloud Body, Circle Tail) ---
 
-def calculate_cloud_path(offset_x=0, offset_y=0):
+def _arc_to_cubics(start, end, r):
     """
-    Generates a cloud-like shape path using a series of semi-circular arcs.
-    FIX: Changed sweep-flag to 0 to make the arcs bulge outward (convex).
+    Converts the SVG arc 'A r r 0 0 0 end' drawn from start into cubic Bezier segments.
+    Follows the SVG endpoint-to-center conversion (the radius grows to half the chord when
+    the chord is longer than the diameter) and splits the sweep into pieces of at most
+    90 degrees. Returns a list of (c1, c2, end) point tuples.
     """
-    CX = CENTER_X + offset_x
-    CY = CENTER_Y + offset_y
-    R = CLOUD_RADIUS # Base radius for the cloud
-
-    # Define the 12 key points around the shape for the cloud's perimeter
-    # Coordinates are slightly offset for an irregular, hand-drawn look
-    points = [
-        (CX + R * 0.9, CY - R * 0.1),
-        (CX + R * 0.8, CY - R * 0.4),
-        (CX + R * 0.4, CY - R * 0.9),
-        (CX + R * 0.1, CY - R * 0.8),
-        (CX - R * 0.5, CY - R * 0.9),
-        (CX - R * 0.9, CY - R * 0.5),
-        (CX - R * 0.8, CY - R * 0.1),
-        (CX - R * 0.9, CY + R * 0.5),
-        (CX - R * 0.4, CY + R * 0.8),
-        (CX + R * 0.1, CY + R * 0.9),
-        (CX + R * 0.5, CY + R * 0.8),
-        (CX + R * 0.9, CY + R * 0.4),
-    ]
-
-    path = f"M {points[0][0]},{points[0][1]}"
-    
-    # Use arcs (A) between each point to create the cloud bumps
-    # sweep-flag = 0 now ensures the arc bulges OUTWARD
-    for i in range(1, len(points)):
-        path += f" A 30 30 0 0 0 {points[i][0]},{points[i][1]}"
-        
-    # Close the loop
-    path += f" A 30 30 0 0 0 {points[0][0]},{points[0][1]}"
+    x1, y1 = start
+    x2, y2 = end
+    hx = (x1 - x2) / 2
+    hy = (y1 - y2) / 2
+    half_chord_sq = hx * hx + hy * hy
+    r = max(r, sqrt(half_chord_sq))
+
+    # large-arc-flag == sweep-flag, so the center is on the negative root side
+    coef = -sqrt(max(0.0, (r * r - half_chord_sq) / half_chord_sq))
+    cx = coef * hy + (x1 + x2) / 2
+    cy = -coef * hx + (y1 + y2) / 2
+
+    # sweep-flag = 0 runs in the negative-angle direction
+    a = atan2(y1 - cy, x1 - cx)
+    sweep = atan2(y2 - cy, x2 - cx) - a
+    if sweep > 0:
+        sweep -= 2 * pi
+
+    n = max(1, ceil(abs(sweep) / (pi / 2) - 1e-9))
+    step = sweep / n
+    k = 4 / 3 * tan(step / 4) * r  # Handle length for one piece
+    segments = []
+    px, py = x1, y1
+    for i in range(n):
+        b = a + step
+        qx, qy = (cx + r * cos(b), cy + r * sin(b)) if i < n - 1 else (x2, y2)
+        segments.append(((px - k * sin(a), py + k * cos(a)), (qx + k * sin(b), qy - k * cos(b)), (qx, qy)))
+        a = b
+        px, py = qx, qy
+    return segments
+
+def _cloud_beziers():
+    """
+    Builds the cloud outline, relative to the cloud center, as an (M, 3, 2) array of
+    cubic Bezier (c1, c2, end) points. Each bump is a 30px arc between neighbouring points;
+    sweep-flag 0 makes the arcs bulge outward (convex).
+    """
+    points = (_CLOUD_RATIOS * CLOUD_RADIUS).tolist()
+    segments = []
+    for start, end in zip(points, points[1:] + points[:1]):
+        segments.extend(_arc_to_cubics(start, end, 30))
+    return np.array(segments)
+
+# The arcs never change, so they are converted once at import time:
+# the start point followed by the (c1, c2, end) points of every segment, as one (1 + 3M, 2) array
+_CLOUD_OUTLINE = np.vstack([_CLOUD_RATIOS[:1] * CLOUD_RADIUS, _cloud_beziers().reshape(-1, 2)])
+
+# The same goes for the path layout, so each path is a single format call
+_CLOUD_PATH_TEMPLATE = "M {:.3f},{:.3f}" + " C {:.3f},{:.3f} {:.3f},{:.3f} {:.3f},{:.3f}" * (len(_CLOUD_OUTLINE) // 3)
+
+def calculate_cloud_paths(offsets):
+    """
+    Generates cloud-like shape paths from the precomputed Bezier bumps,
+    one per (offset_x, offset_y) in offsets.
+    """
+    # Shift the outline to every offset center in one broadcast
+    centers = np.array([(CENTER_X + offset_x, CENTER_Y + offset_y) for offset_x, offset_y in offsets])
+    outlines = (_CLOUD_OUTLINE + centers[:, None, :]).reshape(len(centers), -1).tolist()
+
+    # The last segment ends back at the start point, closing the loop
+    return [_CLOUD_PATH_TEMPLATE.format(*coords) for coords in outlines]
 
-    return path
+def calculate_cloud_path(offset_x=0, offset_y=0):
+    """
+    Generates a cloud-like shape path from a series of round bumps.
+    """
+    return calculate_cloud_paths([(offset_x, offset_y)])[0]
 
 def calculate_thought_bubble_tail(angle_degrees, offset_x=0, offset_y=0, tail_length=15):
     """
     Calculates the position and radius for the diminishing circles of the thought bubble tail.
-    Returns a list of (cx, cy, radius) tuples.
+    Returns an (N, 3) array with one (cx, cy, radius) row per circle.
     """
-    ANGLE_RAD = math.radians(angle_degrees)
+    s, c = _sin_cos(angle_degrees)
     
     # Tail is composed of 3 diminishing circles
     NUM_CIRCLES = 3
-    tail_bubbles = []
-    
-    # Start position for the smallest bubble, determined by the tip extension
-    START_RADIUS = CLOUD_RADIUS + tail_length / NUM_CIRCLES
     
-    for i in range(NUM_CIRCLES):
-        # Calculate radius and size based on index (i=0 is the smallest)
-        bubble_radius = 5 + (NUM_CIRCLES - 1 - i) * 3  # Radii: 5, 8, 11
-        
-        # Calculate distance from center, shrinking toward the cloud body
-        distance_from_center = START_RADIUS + i * (tail_length / NUM_CIRCLES)
-        
-        # Calculate center coordinates
-        cx = (CENTER_X + offset_x) + distance_from_center * math.sin(ANGLE_RAD)
-        cy = (CENTER_Y + offset_y) - distance_from_center * math.cos(ANGLE_RAD)
-        
-        tail_bubbles.append((cx, cy, bubble_radius))
-        
-    return tail_bubbles
+    return _thought_tail_circles(s, c, tail_length, CENTER_X + offset_x, CENTER_Y + offset_y, CLOUD_RADIUS, NUM_CIRCLES)
 
 # --- MAIN DRAWING FUNCTION ---
 
-def create_custom_bubble(bubble_type, angle_degrees, hour, minute, shadow_size, shade_level, tail_length, bubble_text):
+def _bubble_svg(bubble_type, angle_degrees, shadow_size, shade_level, tail_length, bubble_text):
     """
-    Generates an SVG file based on the selected bubble type and user inputs.
+    Builds the complete SVG document for one bubble as a string.
+    The markup is filled into _SVG_TEMPLATE directly (no svgwrite document).
     """
     
     # Set offsets and color based on user input
     SHADOW_OFFSET_X = shadow_size
     SHADOW_OFFSET_Y = shadow_size
-    SHADOW_COLOR = SHADOW_COLORS.get(shade_level, '#000000') 
+    # Levels outside 1-10 are clamped to the nearest end of the scale
+    SHADOW_COLOR = SHADOW_COLORS[max(0, min(len(SHADOW_COLORS) - 1, shade_level - 1))]
     
     STROKE_WIDTH = 4
     FILL_COLOR = '#FFFFFF'
     STROKE_COLOR = 'black'
     
-    dwg = svgwrite.Drawing(FILENAME, size=(WIDTH, HEIGHT), profile='full')
+    body = []
     
     # --- Shadow and Main Body Drawing ---
     
     if bubble_type == 'SPEECH':
         # SPEECH BUBBLE (Oval Path with Curved Tail)
         
+        shadow_path, main_bubble_path = calculate_speech_bubble_paths(
+            angle_degrees, [(SHADOW_OFFSET_X, SHADOW_OFFSET_Y), (0, 0)], tail_length=tail_length)
+        
         # 1. Shadow Path
-        shadow_path = calculate_speech_bubble_path(angle_degrees, SHADOW_OFFSET_X, SHADOW_OFFSET_Y, tail_length=tail_length)
-        dwg.add(dwg.path(d=shadow_path, fill=SHADOW_COLOR, stroke='none'))
+        body.append(f'<path d="{shadow_path}" fill="{SHADOW_COLOR}" stroke="none"/>')
         
         # 2. Main Path
-        main_bubble_path = calculate_speech_bubble_path(angle_degrees, tail_length=tail_length)
-        dwg.add(dwg.path(d=main_bubble_path, fill=FILL_COLOR, stroke=STROKE_COLOR, stroke_width=STROKE_WIDTH, 
-                        stroke_linecap='round', stroke_linejoin='round'))
+        body.append(f'<path d="{main_bubble_path}" fill="{FILL_COLOR}" stroke="{STROKE_COLOR}" stroke-width="{STROKE_WIDTH}" '
+                    'stroke-linecap="round" stroke-linejoin="round"/>')
         
     elif bubble_type == 'THOUGHT':
         # THOUGHT BUBBLE (Cloud Path with Diminishing Circles)
 
+        shadow_cloud_path, main_cloud_path = calculate_cloud_paths([(SHADOW_OFFSET_X, SHADOW_OFFSET_Y), (0, 0)])
+
         # 1. Shadow Cloud Path
-        shadow_cloud_path = calculate_cloud_path(SHADOW_OFFSET_X, SHADOW_OFFSET_Y)
-        dwg.add(dwg.path(d=shadow_cloud_path, fill=SHADOW_COLOR, stroke='none'))
+        body.append(f'<path d="{shadow_cloud_path}" fill="{SHADOW_COLOR}" stroke="none"/>')
         
         # 2. Main Cloud Path
-        main_cloud_path = calculate_cloud_path()
-        dwg.add(dwg.path(d=main_cloud_path, fill=FILL_COLOR, stroke=STROKE_COLOR, stroke_width=STROKE_WIDTH))
+        body.append(f'<path d="{main_cloud_path}" fill="{FILL_COLOR}" stroke="{STROKE_COLOR}" stroke-width="{STROKE_WIDTH}"/>')
 
         # 3. Draw Shadow Tail Bubbles (Behind Main Bubbles)
         shadow_tail_bubbles = calculate_thought_bubble_tail(angle_degrees, SHADOW_OFFSET_X, SHADOW_OFFSET_Y, tail_length=tail_length)
-        for cx, cy, r in shadow_tail_bubbles:
-             dwg.add(dwg.circle(center=(cx, cy), r=r, fill=SHADOW_COLOR, stroke='none'))
+        shadow_style = f'fill="{SHADOW_COLOR}" stroke="none"'
+        body.append("".join([f'<circle cx="{cx:.3f}" cy="{cy:.3f}" r="{r:g}" {shadow_style}/>'
+                             for cx, cy, r in shadow_tail_bubbles.tolist()]))
 
         # 4. Draw Main Tail Bubbles (On Top)
         main_tail_bubbles = calculate_thought_bubble_tail(angle_degrees, tail_length=tail_length)
-        for cx, cy, r in main_tail_bubbles:
-             dwg.add(dwg.circle(center=(cx, cy), r=r, fill=FILL_COLOR, stroke=STROKE_COLOR, stroke_width=STROKE_WIDTH/2))
+        main_style = f'fill="{FILL_COLOR}" stroke="{STROKE_COLOR}" stroke-width="{STROKE_WIDTH / 2:g}"'
+        body.append("".join([f'<circle cx="{cx:.3f}" cy="{cy:.3f}" r="{r:g}" {main_style}/>'
+                             for cx, cy, r in main_tail_bubbles.tolist()]))
         
     # --- Add Text (Same for both types) ---
-    dwg.add(dwg.text(
-        bubble_text,
-        insert=(CENTER_X, CENTER_Y + 10),
-        font_size='22px',
-        text_anchor='middle',
-        fill='black',
-        font_family='Impact, sans-serif'
-    ))
-
-    # Save the SVG file
-    dwg.save(pretty=True)
+    body.append(f'<text x="{CENTER_X:g}" y="{CENTER_Y + 10:g}" font-size="22px" text-anchor="middle" fill="black" '
+                f'font-family="Impact, sans-serif">{escape(bubble_text)}</text>')
+
+    return _SVG_TEMPLATE.format(width=WIDTH, height=HEIGHT, body="".join(body))
+
+def _write_svg(filename, svg_text):
+    """Writes one finished SVG document to filename."""
+    with open(filename, "w", encoding="utf-8") as out:
+        out.write(svg_text)
+
+def create_custom_bubble(bubble_type, angle_degrees, hour, minute, shadow_size, shade_level, tail_length, bubble_text):
+    """
+    Generates an SVG file based on the selected bubble type and user inputs.
+    """
+    _write_svg(FILENAME, _bubble_svg(bubble_type, angle_degrees, shadow_size, shade_level, tail_length, bubble_text))
     print(f"Successfully generated {bubble_type} bubble named '{FILENAME}' with text: '{bubble_text}' and position corresponding to {hour:02d}:{minute:02d}.")
 
 
+def create_bubbles(specs, out_dir='.'):
+    """
+    Generates one SVG file per spec in out_dir and returns the list of written paths.
+    Each spec is a dict with the create_custom_bubble inputs (bubble_type, hour, minute,
+    shadow_size, shade_level, tail_length, bubble_text) and an optional filename
+    (default bubble_001.svg, bubble_002.svg, ...). The documents are built first and
+    then written concurrently, since the file writes are the slow part.
+    """
+    filenames = [os.path.join(out_dir, spec.get('filename', f"bubble_{n:03d}.svg"))
+                 for n, spec in enumerate(specs, start=1)]
+
+    # The writes run concurrently, so two specs for the same file would race; refuse them up front
+    counts = Counter(os.path.normpath(name) for name in filenames)
+    duplicates = sorted(name for name, count in counts.items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate bubble filenames: {', '.join(duplicates)}")
+
+    documents = []
+    for spec in specs:
+        angle_degrees = time_to_angle(spec['hour'], spec['minute'])
+        documents.append(_bubble_svg(spec['bubble_type'], angle_degrees, spec['shadow_size'],
+                                     spec['shade_level'], spec['tail_length'], spec['bubble_text']))
+
+    if out_dir:  # '' means the current directory, which os.makedirs cannot create
+        os.makedirs(out_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_write_svg, filenames, documents))  # list() re-raises any write error
+    return filenames
+
+
 def get_user_input():
     """Prompts the user for all parameters, including bubble type and custom bubble text."""
     
@@ -334,11 +453,45 @@ def get_user_input():
             
     return BUBBLE_TYPE, HOUR, MINUTE, SHADOW_SIZE, SHADE_LEVEL, TAIL_LENGTH, BUBBLE_TEXT
 
+def parse_args(argv):
+    """
+    Reads all parameters from the command line (non-interactive mode), in the same order as
+    get_user_input. Options that are left out get the same defaults as the prompts.
+    """
+    parser = argparse.ArgumentParser(description="Custom SVG Bubble Generator")
+    parser.add_argument("--type", type=str.upper, choices=("SPEECH", "THOUGHT"), default="SPEECH", help="bubble type")
+    parser.add_argument("--hour", type=int, default=3, help="HOUR (1-12) for the tail's ANGLE")
+    parser.add_argument("--minute", type=int, default=45, help="MINUTE (0-59) for the tail's ANGLE")
+    parser.add_argument("--shadow-size", type=int, default=5, help="SHADOW SIZE (e.g., 2 for small, 10 for big)")
+    parser.add_argument("--shade", type=int, default=5, help="SHADE LEVEL (1=light gray, 10=black)")
+    parser.add_argument("--tail", type=int, default=15, help="TAIL LENGTH (e.g., 5 for short, 90 for very long)")
+    parser.add_argument("--text", default="", help="TEXT inside the bubble")
+    args = parser.parse_args(argv)
+
+    # Same limits as the prompts
+    if not (1 <= args.hour <= 12):
+        parser.error("Hour must be between 1 and 12.")
+    if not (0 <= args.minute <= 59):
+        parser.error("Minute must be between 0 and 59.")
+    if args.shadow_size < 0:
+        parser.error("Shadow size must be a positive number.")
+    if not (1 <= args.shade <= 10):
+        parser.error("Shade level must be between 1 and 10.")
+    if args.tail < 0:
+        parser.error("Tail length must be a positive number.")
+
+    text = args.text or ("THINKING..." if args.type == 'THOUGHT' else "ZAP!")
+    return args.type, args.hour, args.minute, args.shadow_size, args.shade, args.tail, text
+
 if __name__ == '__main__':
     
     # --- GET USER INPUT ---
-    print("\n--- Custom SVG Bubble Generator ---")
-    BUBBLE_TYPE, HOUR, MINUTE, SHADOW_SIZE, SHADE_LEVEL, TAIL_LENGTH, BUBBLE_TEXT = get_user_input()
+    if len(sys.argv) > 1:
+        # Non-interactive: everything comes from the command line
+        BUBBLE_TYPE, HOUR, MINUTE, SHADOW_SIZE, SHADE_LEVEL, TAIL_LENGTH, BUBBLE_TEXT = parse_args(sys.argv[1:])
+    else:
+        print("\n--- Custom SVG Bubble Generator ---")
+        BUBBLE_TYPE, HOUR, MINUTE, SHADOW_SIZE, SHADE_LEVEL, TAIL_LENGTH, BUBBLE_TEXT = get_user_input()
     
     # Calculate the angle based on the chosen time
     calculated_angle = time_to_angle(HOUR, MINUTE)